@@ -1,22 +1,19 @@
 """AutoMoLi.
-   Automatic Motion Lights
+ Automatic Motion Lights
 
-  @benleb / https://github.com/benleb/ad-automoli
+@benleb / https://github.com/benleb/ad-automoli
 """
 
 __version__ = "0.8.3"
 
 import asyncio
 
-from copy import deepcopy
 from datetime import time
 from pprint import pformat
-from sys import version_info
-from typing import Any, Coroutine, Dict, Iterable, List, Optional, Set, Union
+from typing import Any, Coroutine, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, Union
 
 import hassapi as hass
 
-
 APP_NAME = "AutoMoLi"
 APP_ICON = "💡"
 
@@ -43,26 +40,19 @@ KEYWORD_MOTION = "binary_sensor.motion_sensor_"
 KEYWORD_HUMIDITY = "sensor.humidity_"
 KEYWORD_ILLUMINANCE = "sensor.illumination_"
 
-KEYWORDS = {
-    "humidity": "sensor.humidity_",
-    "illuminance": "sensor.illumination_",
-    "light": "light.",
-    "motion": "binary_sensor.motion_sensor_",
+# optional sensor type → (discovery keyword, threshold key)
+_SENSOR_META: Dict[str, Tuple[str, str]] = {
+    "humidity": (KEYWORD_HUMIDITY, "humidity"),
+    "illuminance": (KEYWORD_ILLUMINANCE, "illuminance"),
 }
 
-SENSORS_REQUIRED = ["motion"]
-SENSORS_OPTIONAL = ["humidity", "illuminance"]
+# lowercase umlauts → plain letters, applied after lower() to match room names
+_UMLAUTS = str.maketrans({"ä": "a", "ö": "o", "ü": "u", "ß": "s"})
 
 RANDOMIZE_SEC = 5
 SECONDS_PER_MIN: int = 60
 
 
-# version checks
-py3_or_higher = version_info.major >= 3
-py37_or_higher = py3_or_higher and version_info.minor >= 7
-py38_or_higher = py3_or_higher and version_info.minor >= 8
-
-
 def hl(text: Union[int, float, str]) -> str:
     return f"\033[1m{text}\033[0m"
 
@@ -94,7 +84,8 @@ class AutoMoLi(hass.Hass):  # type: ignore
     def lg(self, msg: str, *args: Any, icon: Optional[str] = None, repeat: int = 1, **kwargs: Any) -> None:
         kwargs.setdefault("ascii_encode", False)
         message = f"{f'{icon} ' if icon else ' '}{msg}"
-        _ = [self.log(message, *args, **kwargs) for _ in range(repeat)]
+        for _ in range(repeat):
+            self.log(message, *args, **kwargs)
 
     def listr(self, list_or_string: Union[List[str], Set[str], str], entities_exist: bool = True) -> Set[str]:
         entity_list: List[str] = []
@@ -115,19 +106,10 @@ class AutoMoLi(hass.Hass):  # type: ignore
         # get a real dict for the configuration
         self.args = dict(self.args)
 
-        # python version check
-        if not py38_or_higher:
-            icon_alert = "⚠️"
-            self.lg("", icon=icon_alert)
-            self.lg("")
-            self.lg(f" please update to {hl('Python >= 3.8')}! 🤪", icon=icon_alert)
-            self.lg("")
-            self.lg("", icon=icon_alert)
-        if not py37_or_higher:
-            raise ValueError
-
         # set room
         self.room = str(self.args.pop("room"))
+        self._room_cap = self.room.capitalize()
+        self._hl_room = hl(self._room_cap)
 
         # general delay
         self.delay = int(self.args.pop("delay", DEFAULT_DELAY))
@@ -185,6 +167,14 @@ class AutoMoLi(hass.Hass):  # type: ignore
 
         # currently active daytime settings
         self.active: Dict[str, Union[int, str]] = {}
+        self._delay: Optional[int] = None
+        self._light_setting: Optional[Union[int, str]] = None
+        self._is_hue_group: bool = False
+        self._is_scene: bool = False
+        self._scene_name: Optional[str] = None
+        self._hl_delay: str = ""
+        self._hl_light_setting: str = ""
+        self._turn_on_kwargs_dim: Dict[str, Any] = {}
 
         # entity lists for initial discovery
         states = await self.get_state()
@@ -203,7 +193,7 @@ class AutoMoLi(hass.Hass):  # type: ignore
 
         # enumerate sensors for motion detection
         self.sensors["motion"] = self.listr(
-            self.args.pop("motion", await self.find_sensors(KEYWORD_MOTION, self.room, states))
+            self.args.pop("motion", None) or await self.find_sensors(KEYWORD_MOTION, self.room, states)
         )
 
         # requirements check
@@ -219,46 +209,93 @@ class AutoMoLi(hass.Hass):  # type: ignore
             self.lg("")
             return
 
+        # partition lights once into switches, dimmable lights and hue groups
+        lights = list(self.lights)
+        self._switch_lights: FrozenSet[str] = frozenset(light for light in lights if light.startswith("switch."))
+        self._dimmable_lights: FrozenSet[str] = frozenset(lights) - self._switch_lights
+        self._hue_group_lights: FrozenSet[str] = frozenset()
+        if not self.disable_hue_groups:
+            hue_flags = await asyncio.gather(
+                *[self.get_state(entity_id=entity, attribute="is_hue_group") for entity in lights]
+            )
+            self._hue_group_lights = frozenset(light for light, is_hue_group in zip(lights, hue_flags) if is_hue_group)
+
+        # service data to switch on the switches, independent of the daytime
+        self._turn_on_kwargs_switch: Dict[str, Any] = {"entity_id": list(self._switch_lights)}
+
         # enumerate optional sensors & disable optional features if sensors are not available
-        for sensor_type in SENSORS_OPTIONAL:
+        for sensor_type, (keyword, threshold_key) in _SENSOR_META.items():
 
-            if sensor_type in self.thresholds and self.thresholds[sensor_type]:
-                self.sensors[sensor_type] = self.listr(self.args.pop("motion", None)) or await self.find_sensors(
-                    KEYWORDS[sensor_type], self.room, states
+            if threshold := self.thresholds.get(threshold_key):
+                self.sensors[sensor_type] = self.listr(self.args.pop(sensor_type, None)) or await self.find_sensors(
+                    keyword, self.room, states
                 )
 
             else:
                 self.lg(
-                    f"No {sensor_type} sensors → disabling features based on {sensor_type}"
-                    f" - {self.thresholds[sensor_type]}.",
+                    f"No {sensor_type} sensors → disabling features based on {sensor_type} - {threshold}.",
                     level="DEBUG",
                 )
-                del self.thresholds[sensor_type]
+                self.thresholds.pop(threshold_key, None)
+
+        self._humidity_threshold = self.thresholds.get("humidity")
+        self._illuminance_threshold = self.thresholds.get("illuminance")
+
+        # sensors used on every event, self.sensors is kept for the config output
+        self._motion_sensors: FrozenSet[str] = frozenset(self.sensors["motion"])
+        self._humidity_sensors: FrozenSet[str] = frozenset(self.sensors.get("humidity", ()))
+        self._illuminance_sensors: FrozenSet[str] = frozenset(self.sensors.get("illuminance", ()))
 
         # use user-defined daytimes if available
         daytimes = await self.build_daytimes(self.args.pop("daytimes", DEFAULT_DAYTIMES))
 
-        # set up event listener for each sensor
-        listener: Set[Coroutine[Any, Any, Any]] = set()
-        for sensor in self.sensors["motion"]:
+        # motion sensors currently reporting motion
+        self._active_motion: Set[str] = set()
 
-            # listen to xiaomi sensors by default
-            if not any([self.states["motion_on"], self.states["motion_off"]]):
-                self.lg("no motion states configured - using event listener", level="DEBUG")
-                listener.add(self.listen_event(self.motion_event, event=EVENT_MOTION_XIAOMI, entity_id=sensor))
+        # set up one event listener for all sensors, events are dispatched by entity
+        listener: Set[Coroutine[Any, Any, Any]] = set()
 
-            # on/off-only sensors without events on every motion
-            elif all([self.states["motion_on"], self.states["motion_off"]]):
-                self.lg("both motion states configured - using state listener", level="DEBUG")
-                listener.add(self.listen_state(self.motion_detected, entity=sensor, new=self.states["motion_on"]))
-                listener.add(self.listen_state(self.motion_cleared, entity=sensor, new=self.states["motion_off"]))
+        # listen to xiaomi sensors by default
+        if not any([self.states["motion_on"], self.states["motion_off"]]):
+            self.lg("no motion states configured - using event listener", level="DEBUG")
+            listener.add(self.listen_event(self._motion_event_dispatch, event=EVENT_MOTION_XIAOMI))
+
+        # on/off-only sensors without events on every motion
+        elif all([self.states["motion_on"], self.states["motion_off"]]):
+            self.lg("both motion states configured - using state listener", level="DEBUG")
+            # listen per domain of the motion sensors (usually just binary_sensor) instead of all entities
+            for domain in {sensor.split(".")[0] for sensor in self._motion_sensors}:
+                listener.add(
+                    self.listen_state(self._motion_state_dispatch, entity=domain, new=self.states["motion_on"])
+                )
+                listener.add(
+                    self.listen_state(self._motion_state_dispatch, entity=domain, new=self.states["motion_off"])
+                )
 
-        # callback handles to switch lights off
-        self.handles: Set[str] = set()
+        # cache illuminance/humidity readings on change instead of polling them on every event
+        self._illuminance_by_sensor: Dict[str, float] = {}
+        self._humidity_by_sensor: Dict[str, float] = {}
+        self._illuminance_blocked: bool = False
+        self._humidity_blocked: bool = False
+        if self._illuminance_threshold:
+            for sensor in self._illuminance_sensors:
+                listener.add(self.listen_state(self._on_illuminance, entity=sensor))
+        if self._humidity_threshold:
+            for sensor in self._humidity_sensors:
+                listener.add(self.listen_state(self._on_humidity, entity=sensor))
+
+        # lights known to be on, reset if any light is switched off (also from outside automoli)
+        self._is_on: bool = False
+        for light in self.lights:
+            listener.add(self.listen_state(self._light_switched_off, entity=light, new="off"))
+
+        # callback handles to dim and switch lights off
+        self._handle: Optional[str] = None
+        self._dim_handle: Optional[str] = None
 
         self.args.update(
             {
-                "room": self.room.capitalize(),
+                "room": self._room_cap,
                 "delay": self.delay,
                 "active_daytime": self.active_daytime,
                 "daytimes": daytimes,
@@ -266,7 +303,7 @@ class AutoMoLi(hass.Hass):  # type: ignore
                 "dim": self.dim,
                 "sensors": self.sensors,
                 "disable_hue_groups": self.disable_hue_groups,
-                "only_own_events": self.only_own_events
+                "only_own_events": self.only_own_events,
             }
         )
 
@@ -278,6 +315,27 @@ class AutoMoLi(hass.Hass):  # type: ignore
         self.show_info(self.args)
 
         await asyncio.gather(*listener)
+
+        # reconcile the active motion sensors with the current sensor states
+        if self.states["motion_on"]:
+            sensors = list(self._motion_sensors)
+            states = await asyncio.gather(*[self.get_state(sensor) for sensor in sensors])
+            self._active_motion = {
+                sensor for sensor, state in zip(sensors, states) if state == self.states["motion_on"]
+            }
+
+        # initial illuminance/humidity readings
+        if self._illuminance_threshold:
+            sensors = list(self._illuminance_sensors)
+            states = await asyncio.gather(*[self.get_state(sensor) for sensor in sensors])
+            for sensor, state in zip(sensors, states):
+                await self._on_illuminance(sensor, "state", None, state, {})
+        if self._humidity_threshold:
+            sensors = list(self._humidity_sensors)
+            states = await asyncio.gather(*[self.get_state(sensor) for sensor in sensors])
+            for sensor, state in zip(sensors, states):
+                await self._on_humidity(sensor, "state", None, state, {})
+
         await self.refresh_timer()
 
     async def switch_daytime(self, kwargs: Dict[str, Any]) -> None:
@@ -286,43 +344,72 @@ class AutoMoLi(hass.Hass):  # type: ignore
 
         if daytime is not None:
             self.active = daytime
-            if not kwargs.get("initial"):
 
-                delay = daytime["delay"]
-                light_setting = daytime["light_setting"]
-                if isinstance(light_setting, str):
-                    is_scene = True
-                    # if its a ha scene, remove the "scene." part
-                    if "." in light_setting:
-                        light_setting = (light_setting.split("."))[1]
-                else:
-                    is_scene = False
+            # cache the settings used on every motion event
+            self._delay = int(daytime["delay"])
+            self._light_setting = daytime["light_setting"]
+            self._is_hue_group = bool(daytime["is_hue_group"])
+            self._is_scene = isinstance(self._light_setting, str)
+            # if its a ha scene, remove the "scene." part
+            self._scene_name = self._light_setting.split(".")[-1] if self._is_scene else None
+
+            # highlighted log fragments of the active daytime
+            self._hl_delay = hl(natural_time(self._delay))
+            self._hl_light_setting = hl(self._scene_name if self._is_scene else self._light_setting)
+
+            # service data to switch on the dimmable lights with the active brightness
+            self._turn_on_kwargs_dim = {
+                "entity_id": list(self._dimmable_lights),
+                "brightness_pct": self._light_setting,
+            }
 
+            if not kwargs.get("initial"):
                 self.lg(
-                    f"set {hl(self.room.capitalize())} to {hl(daytime['daytime'])} → "
-                    f"{'scene' if is_scene else 'brightness'}: {hl(light_setting)}"
-                    f"{'' if is_scene else '%'}, delay: {hl(natural_time(delay))}",
+                    f"set {self._hl_room} to {hl(daytime['daytime'])} → "
+                    f"{'scene' if self._is_scene else 'brightness'}: "
+                    f"{self._hl_light_setting}{'' if self._is_scene else '%'}, delay: {self._hl_delay}",
                     icon=DAYTIME_SWITCH_ICON,
                 )
 
+    async def _motion_state_dispatch(
+        self, entity: str, attribute: str, old: str, new: str, kwargs: Dict[str, Any]
+    ) -> None:
+        """Route state changes of this room's motion sensors."""
+        if entity not in self._motion_sensors:
+            return
+
+        if new == self.states["motion_on"]:
+            await self.motion_detected(entity, attribute, old, new, kwargs)
+        elif new == self.states["motion_off"]:
+            await self.motion_cleared(entity, attribute, old, new, kwargs)
+
+    async def _motion_event_dispatch(self, event: str, data: Dict[str, str], kwargs: Dict[str, Any]) -> None:
+        """Route motion events of this room's motion sensors."""
+        if data.get("entity_id") in self._motion_sensors:
+            await self.motion_event(event, data, kwargs)
+
     async def motion_cleared(self, entity: str, attribute: str, old: str, new: str, kwargs: Dict[str, Any]) -> None:
         # starte the timer if motion is cleared
         self.lg(f"motion cleared: {entity} changed {attribute} from {old} to {new}", level="DEBUG")
 
-        if all([await self.get_state(sensor) == self.states["motion_off"] for sensor in self.sensors["motion"]]):
+        self._active_motion.discard(entity)
+
+        if not self._active_motion:
             # all motion sensors off, starting timer
             await self.refresh_timer()
         else:
             # cancel scheduled callbacks
-            await self.clear_handles(deepcopy(self.handles))
+            await self.clear_handles()
 
     async def motion_detected(self, entity: str, attribute: str, old: str, new: str, kwargs: Dict[str, Any]) -> None:
         # wrapper function
 
         self.lg(f"motion detected: {entity} changed {attribute} from {old} to {new}", level="DEBUG")
 
+        self._active_motion.add(entity)
+
         # cancel scheduled callbacks
-        await self.clear_handles(deepcopy(self.handles))
+        await self.clear_handles()
 
         self.lg("handles cleared and cancelled all scheduled timers", level="DEBUG")
 
@@ -338,39 +425,100 @@ class AutoMoLi(hass.Hass):  # type: ignore
         if await self.is_disabled():
             return
 
+        # poll the light states only if they are not known to be on
+        if not self._is_on:
+            states = await asyncio.gather(*[self.get_state(light) for light in self.lights])
+            self._is_on = any(state == "on" for state in states)
+
         # turn on the lights if not already
-        if not any([await self.get_state(light) == "on" for light in self.lights]):
+        if not self._is_on:
             await self.lights_on()
         else:
-            self.lg(f"light in {self.room.capitalize()} already on → refreshing the timer", level="DEBUG")
+            self.lg(f"light in {self._room_cap} already on → refreshing the timer", level="DEBUG")
 
         if event != "state_changed_detection":
             await self.refresh_timer()
 
-    async def clear_handles(self, handles: Set[str]) -> None:
+    async def _light_switched_off(
+        self, entity: str, attribute: str, old: str, new: str, kwargs: Dict[str, Any]
+    ) -> None:
+        # poll the light states again on the next motion event
+        self._is_on = False
+
+    async def _on_illuminance(
+        self, entity: str, attribute: str, old: Optional[str], new: str, kwargs: Dict[str, Any]
+    ) -> None:
+        """Cache the illuminance reading and if it blocks switching the lights on."""
+        self._store_reading(self._illuminance_by_sensor, entity, new)
+        self._illuminance_blocked = any(
+            illuminance >= self._illuminance_threshold for illuminance in self._illuminance_by_sensor.values()
+        )
+
+    async def _on_humidity(
+        self, entity: str, attribute: str, old: Optional[str], new: str, kwargs: Dict[str, Any]
+    ) -> None:
+        """Cache the humidity reading and if it blocks switching the lights off."""
+        self._store_reading(self._humidity_by_sensor, entity, new)
+        self._humidity_blocked = any(
+            humidity >= self._humidity_threshold for humidity in self._humidity_by_sensor.values()
+        )
+
+    def _store_reading(self, readings: Dict[str, float], sensor: str, state: Any) -> None:
+        try:
+            readings[sensor] = float(state)
+        except (TypeError, ValueError) as error:
+            readings.pop(sensor, None)
+            self.lg(f"could not parse '{state}' from '{sensor}': {error}", level="DEBUG")
+
+    async def clear_handles(self) -> None:
         """clear scheduled timers/callbacks."""
-        self.handles.clear()
-        [await self.cancel_timer(handle) for handle in handles]
+        handles = (self._handle, self._dim_handle)
+        self._handle = self._dim_handle = None
+
+        await self._cancel_handles(*handles)
+
+    async def _cancel_handles(self, *handles: Optional[str]) -> None:
+        if pending := [handle for handle in handles if handle is not None]:
+            await asyncio.gather(*[self._cancel_handle(handle) for handle in pending])
+
+    async def _cancel_handle(self, handle: str) -> None:
+        # skip already fired timers to avoid "Invalid callback handle" warnings
+        if await self.timer_running(handle):
+            await self.cancel_timer(handle)
 
     async def refresh_timer(self) -> None:
-        """refresh delay timer."""
+        """cancel scheduled timers once and reschedule them with the active delay."""
 
         # cancel scheduled callbacks
-        await self.clear_handles(deepcopy(self.handles))
+        await self.clear_handles()
 
         # if no delay is set or delay = 0, lights will not switched off by AutoMoLi
-        if delay := self.active.get("delay"):
+        if delay := self._delay:
 
+            # schedule "dim" and "turn off" callbacks
             if self.dim:
-                self.handles.add(await self.run_in(self.dim_lights, (int(delay) - self.dim["seconds_before"] + 2)))
+                dim_handle, handle = await asyncio.gather(
+                    self.run_in(self.dim_lights, (delay - self.dim["seconds_before"] + 2)),
+                    self.run_in(self.lights_off, delay),
+                )
+
+                # a concurrent refresh may have stored its timers meanwhile, cancel them before they get lost
+                stale = (self._handle, self._dim_handle)
+                self._handle, self._dim_handle = handle, dim_handle
+                await self._cancel_handles(*stale)
+            else:
+                handle = await self.run_in(self.lights_off, delay)
 
-            # schedule "turn off" callback
-            self.handles.add(await self.run_in(self.lights_off, delay))
+                # a concurrent refresh may have stored its timer meanwhile, cancel it before it gets lost
+                stale, self._handle = self._handle, handle
+                await self._cancel_handles(stale)
 
     async def is_disabled(self) -> bool:
         """check if automoli is disabled via home assistant entity"""
-        for entity in self.disable_switch_entities:
-            if (state := await self.get_state(entity, copy=False)) and state in self.disable_switch_states:
+        entities = list(self.disable_switch_entities)
+        states = await asyncio.gather(*[self.get_state(entity, copy=False) for entity in entities])
+        for entity, state in zip(entities, states):
+            if state and state in self.disable_switch_states:
                 self.lg(f"{APP_NAME} is disabled by {entity} with {state = }")
                 return True
 
@@ -381,12 +529,13 @@ class AutoMoLi(hass.Hass):  # type: ignore
         message: str = ""
         lights_to_dim: List[Coroutine[Any, Any, Any]] = []
 
-        if not any([await self.get_state(light) == "on" for light in self.lights]):
+        states = await asyncio.gather(*[self.get_state(light) for light in self.lights])
+        if not any(state == "on" for state in states):
             return
 
         if self.dim["method"] == "step":
             message = (
-                f"{hl(self.room.capitalize())} → dim to {hl(self.dim['brightness_step_pct'])} | "
+                f"{self._hl_room} → dim to {hl(self.dim['brightness_step_pct'])} | "
                 f"{hl('off')} in {natural_time(int(self.dim['seconds_before']))}"
             )
             lights_to_dim = [
@@ -395,9 +544,7 @@ class AutoMoLi(hass.Hass):  # type: ignore
             ]
 
         elif self.dim["method"] == "transition":
-            message = (
-                f"{hl(self.room.capitalize())} → transition to {hl('off')} ({natural_time(self.dim['seconds_before'])})"
-            )
+            message = f"{self._hl_room} → transition to {hl('off')} ({natural_time(self.dim['seconds_before'])})"
             lights_to_dim = [
                 self.call_service("light/turn_off", entity_id=light, transition=self.dim["seconds_before"])
                 for light in self.lights
@@ -412,83 +559,81 @@ class AutoMoLi(hass.Hass):  # type: ignore
 
     async def lights_on(self) -> None:
         """Turn on the lights."""
-        if illuminance_threshold := self.thresholds.get("illuminance"):
-
-            # the "eco mode" check
-            for sensor in self.sensors["illuminance"]:
-                try:
-                    if (illuminance := float(await self.get_state(sensor))) >= illuminance_threshold:
-                        self.lg(
-                            f"According to {hl(sensor)} its already bright enough ¯\\_(ツ)_/¯"
-                            f" | {illuminance} >= {illuminance_threshold}"
-                        )
-                        return
-
-                except ValueError as error:
-                    self.lg(f"could not parse illuminance '{await self.get_state(sensor)}' from '{sensor}': {error}")
-                    return
+        # the "eco mode" check
+        if self._illuminance_blocked:
+            sensor, illuminance = max(self._illuminance_by_sensor.items(), key=lambda reading: reading[1])
+            self.lg(
+                f"According to {hl(sensor)} its already bright enough ¯\\_(ツ)_/¯"
+                f" | {illuminance} >= {self._illuminance_threshold}"
+            )
+            return
 
-        if (light_setting := self.active.get("light_setting")) and isinstance(light_setting, str):
+        if self._is_scene and (light_setting := self._light_setting):
 
             # last check until we switch the lights on... really!
-            if any([await self.get_state(light) == "on" for light in self.lights]):
+            states = await asyncio.gather(*[self.get_state(light) for light in self.lights])
+            if any(state == "on" for state in states):
                 self.lg("¯\\_(ツ)_/¯")
                 return
 
-            for entity in self.lights:
+            hue_groups = self._hue_group_lights if self._is_hue_group else frozenset()
 
-                if self.active["is_hue_group"] and await self.get_state(entity_id=entity, attribute="is_hue_group"):
-                    await self.call_service(
-                        "hue/hue_activate_scene", group_name=await self.friendly_name(entity), scene_name=light_setting
-                    )
-                    if self.only_own_events:
-                        self._switched_on_by_automoli.add(entity)
-                    continue
+            for entity in hue_groups:
+                await self.call_service(
+                    "hue/hue_activate_scene", group_name=await self.friendly_name(entity), scene_name=light_setting
+                )
 
-                item = light_setting if light_setting.startswith("scene.") else entity
+            # a ha scene is activated once, other entities are switched on in a single call
+            entities = [entity for entity in self.lights if entity not in hue_groups]
+            items = [light_setting] if entities and light_setting.startswith("scene.") else entities
 
-                await self.call_service("homeassistant/turn_on", entity_id=item)
-                if self.only_own_events:
-                    self._switched_on_by_automoli.add(item)
+            if items:
+                await self.call_service("homeassistant/turn_on", entity_id=items)
+
+            if self.only_own_events:
+                self._switched_on_by_automoli.update(hue_groups, items)
+
+            self._is_on = True
 
             self.lg(
-                f"{hl(self.room.capitalize())} turned {hl(f'on')} → "
-                f"{'hue' if self.active['is_hue_group'] else 'ha'} scene: "
-                f"{hl(light_setting.replace('scene.', ''))}"
-                f" | delay: {hl(natural_time(int(self.active['delay'])))}",
+                f"{self._hl_room} turned {hl(f'on')} → "
+                f"{'hue' if self._is_hue_group else 'ha'} scene: {self._hl_light_setting}"
+                f" | delay: {self._hl_delay}",
                 icon=ON_ICON,
             )
 
-        elif isinstance(self.active["light_setting"], int):
+        elif isinstance(self._light_setting, int):
 
-            if self.active["light_setting"] == 0:
+            if self._light_setting == 0:
                 await self.lights_off({})
 
             else:
                 # last check until we switch the lights on... really!
-                if any([await self.get_state(light) == "on" for light in self.lights]):
+                states = await asyncio.gather(*[self.get_state(light) for light in self.lights])
+                if any(state == "on" for state in states):
                     self.lg("¯\\_(ツ)_/¯")
                     return
 
-                for entity in self.lights:
-                    if entity.startswith("switch."):
-                        await self.call_service("homeassistant/turn_on", entity_id=entity)
-                    else:
-                        await self.call_service(
-                            "homeassistant/turn_on", entity_id=entity, brightness_pct=self.active["light_setting"]
-                        )
-
-                        self.lg(
-                            f"{hl(self.room.capitalize())} turned {hl(f'on')} → "
-                            f"brightness: {hl(self.active['light_setting'])}%"
-                            f" | delay: {hl(natural_time(int(self.active['delay'])))}",
-                            icon=ON_ICON,
-                        )
-                    if self.only_own_events:
-                        self._switched_on_by_automoli.add(entity)
+                if self._switch_lights:
+                    await self.call_service("homeassistant/turn_on", **self._turn_on_kwargs_switch)
+
+                if self._dimmable_lights:
+                    await self.call_service("homeassistant/turn_on", **self._turn_on_kwargs_dim)
+
+                    self.lg(
+                        f"{self._hl_room} turned {hl(f'on')} → "
+                        f"brightness: {self._hl_light_setting}%"
+                        f" | delay: {self._hl_delay}",
+                        icon=ON_ICON,
+                    )
+
+                if self.only_own_events:
+                    self._switched_on_by_automoli.update(self.lights)
+
+                self._is_on = True
 
         else:
-            raise ValueError(f"invalid brightness/scene: {self.active['light_setting']!s} " f"in {self.room}")
+            raise ValueError(f"invalid brightness/scene: {self._light_setting!s} " f"in {self.room}")
 
     async def lights_off(self, kwargs: Dict[str, Any]) -> None:
         """Turn off the lights."""
@@ -498,70 +643,59 @@ class AutoMoLi(hass.Hass):  # type: ignore
             return
 
         # the "shower case" check
-        if humidity_threshold := self.thresholds.get("humidity"):
-            for sensor in self.sensors["humidity"]:
-                try:
-                    current_humidity = float(await self.get_state(sensor))
-                except ValueError as error:
-                    self.lg(f"self.get_state(sensor) raised a ValueError: {error}", level="ERROR")
-                    continue
-
-                if current_humidity >= humidity_threshold:
-                    # blocker.append(sensor)
-                    await self.refresh_timer()
-                    self.lg(
-                        f"🛁 no motion in {hl(self.room.capitalize())} since "
-                        f"{hl(natural_time(int(self.active['delay'])))} → "
-                        f"but {hl(current_humidity)}%RH > "
-                        f"{hl(humidity_threshold)}%RH"
-                    )
-                    return
+        if self._humidity_blocked:
+            current_humidity = max(self._humidity_by_sensor.values())
+            await self.refresh_timer()
+            self.lg(
+                f"🛁 no motion in {self._hl_room} since "
+                f"{self._hl_delay} → "
+                f"but {hl(current_humidity)}%RH > "
+                f"{hl(self._humidity_threshold)}%RH"
+            )
+            return
 
         # cancel scheduled callbacks
-        await self.clear_handles(deepcopy(self.handles))
+        await self.clear_handles()
 
-        if any([await self.get_state(entity) == "on" for entity in self.lights]):
-            at_least_one_turned_off = False
-            for entity in self.lights:
-                if self.only_own_events:
-                    if entity in self._switched_on_by_automoli:
-                        await self.call_service("homeassistant/turn_off", entity_id=entity)
-                        self._switched_on_by_automoli.remove(entity)
-                        at_least_one_turned_off = True
-                else:
-                    await self.call_service("homeassistant/turn_off", entity_id=entity)
-                    at_least_one_turned_off = True
-            if at_least_one_turned_off:
+        states = await asyncio.gather(*[self.get_state(entity) for entity in self.lights])
+        if any(state == "on" for state in states):
+            if self.only_own_events:
+                entities = [entity for entity in self.lights if entity in self._switched_on_by_automoli]
+                self._switched_on_by_automoli.difference_update(entities)
+            else:
+                entities = list(self.lights)
+
+            if entities:
+                await self.call_service("homeassistant/turn_off", entity_id=entities)
+                self._is_on = False
                 self.lg(
-                    f"no motion in {hl(self.room.capitalize())} since "
-                    f"{hl(natural_time(int(self.active['delay'])))} → turned {hl(f'off')}",
+                    f"no motion in {self._hl_room} since {self._hl_delay} → turned {hl('off')}",
                     icon=OFF_ICON,
                 )
 
             # experimental | reset for xiaomi "super motion" sensors | idea from @wernerhp
             # app: https://github.com/wernerhp/appdaemon_aqara_motion_sensors
             # mod: https://community.smartthings.com/t/making-xiaomi-motion-sensor-a-super-motion-sensor/139806
-            for sensor in self.sensors["motion"]:
-                await self.set_state(
-                    sensor,
-                    state="off",
-                    attributes=(await self.get_state(sensor, attribute="all")).get("attributes", {}),
-                )
+            sensors = list(self._motion_sensors)
+            states = await asyncio.gather(*[self.get_state(sensor, attribute="all") for sensor in sensors])
+            await asyncio.gather(
+                *[
+                    self.set_state(sensor, state="off", attributes=state.get("attributes", {}))
+                    for sensor, state in zip(sensors, states)
+                ]
+            )
 
     async def find_sensors(self, keyword: str, room_name: str, states: Dict[str, Dict[str, Any]]) -> List[str]:
         """Find sensors by looking for a keyword in the friendly_name."""
 
-        def lower_umlauts(text: str, single: bool = True) -> str:
-            return (
-                text.replace("ä", "a").replace("ö", "o").replace("ü", "u").replace("ß", "s")
-                if single
-                else text.replace("ä", "ae").replace("ö", "oe").replace("ü", "ue").replace("ß", "ss")
-            ).lower()
+        room = room_name.lower().translate(_UMLAUTS)
 
+        # match against the already fetched states, no further lookups needed
         matches: List[str] = []
-        for state in states.values():
-            if keyword in (entity_id := state.get("entity_id", "")) and lower_umlauts(room_name) in "|".join(
-                [entity_id, lower_umlauts(state.get("attributes", {}).get("friendly_name", ""))]
+        for entity_id, state in states.items():
+            if keyword in entity_id and (
+                room in entity_id
+                or room in state.get("attributes", {}).get("friendly_name", "").lower().translate(_UMLAUTS)
             ):
                 matches.append(entity_id)
 
@@ -569,37 +703,39 @@ class AutoMoLi(hass.Hass):  # type: ignore
 
     async def build_daytimes(self, daytimes: List[Any]) -> Optional[List[Dict[str, Union[int, str]]]]:
         starttimes: Set[time] = set()
+        configs: List[Dict[str, Union[int, str]]] = []
+        periods: List[Tuple[time, time]] = []
+
+        # parse all start times concurrently
+        parsed_starts = await asyncio.gather(
+            *[self.parse_time(daytime.get("starttime") + ":00", aware=True) for daytime in daytimes],
+            return_exceptions=True,
+        )
 
-        for idx, daytime in enumerate(daytimes):
+        for idx, (daytime, dt_start) in enumerate(zip(daytimes, parsed_starts)):
             dt_name = daytime.get("name", f"{DEFAULT_NAME}_{idx}")
             dt_delay = daytime.get("delay", self.delay)
             dt_light_setting = daytime.get("light", DEFAULT_LIGHT_SETTING)
-            if self.disable_hue_groups:
-                dt_is_hue_group = False
-            else:
-                dt_is_hue_group = (
-                    isinstance(dt_light_setting, str)
-                    and not dt_light_setting.startswith("scene.")
-                    and any(
-                    await asyncio.gather(
-                        *[self.get_state(entity_id=entity, attribute="is_hue_group") for entity in self.lights]
-                    )
-                )
-                )
+            dt_is_hue_group = (
+                isinstance(dt_light_setting, str)
+                and not dt_light_setting.startswith("scene.")
+                and bool(self._hue_group_lights)
+            )
 
-            dt_start: time
-            try:
-                dt_start = await self.parse_time(daytime.get("starttime") + ":00", aware=True)
-            except ValueError as error:
-                raise ValueError(f"missing start time in daytime '{dt_name}': {error}")
+            if isinstance(dt_start, ValueError):
+                raise ValueError(f"missing start time in daytime '{dt_name}': {dt_start}")
+            elif isinstance(dt_start, BaseException):
+                raise dt_start
 
             # configuration for this daytime
-            daytime = dict(
-                daytime=dt_name,
-                delay=dt_delay,
-                starttime=dt_start.isoformat(),  # datetime is not serializable
-                light_setting=dt_light_setting,
-                is_hue_group=dt_is_hue_group,
+            configs.append(
+                dict(
+                    daytime=dt_name,
+                    delay=dt_delay,
+                    starttime=dt_start.isoformat(),  # datetime is not serializable
+                    light_setting=dt_light_setting,
+                    is_hue_group=dt_is_hue_group,
+                )
             )
 
             # info about next daytime
@@ -611,19 +747,28 @@ class AutoMoLi(hass.Hass):  # type: ignore
 
             starttimes.add(dt_start)
 
-            # check if this daytime should ne active now
-            if await self.now_is_between(str(dt_start), str(next_dt_start)):
+            periods.append((dt_start, next_dt_start))
+
+        # check which daytime should be active now
+        active = await asyncio.gather(*[self.now_is_between(str(start), str(end)) for start, end in periods])
+        for daytime, is_active in zip(configs, active):
+            if is_active:
                 await self.switch_daytime(dict(daytime=daytime, initial=True))
                 self.active_daytime = daytime.get("daytime")
 
-            # schedule callbacks for daytime switching
-            await self.run_daily(
-                self.switch_daytime,
-                dt_start,
-                random_start=-RANDOMIZE_SEC,
-                random_end=RANDOMIZE_SEC,
-                **dict(daytime=daytime),
-            )
+        # schedule callbacks for daytime switching
+        await asyncio.gather(
+            *[
+                self.run_daily(
+                    self.switch_daytime,
+                    dt_start,
+                    random_start=-RANDOMIZE_SEC,
+                    random_end=RANDOMIZE_SEC,
+                    **dict(daytime=daytime),
+                )
+                for daytime, dt_start in zip(configs, parsed_starts)
+            ]
+        )
 
         return daytimes
 
@@ -693,19 +838,15 @@ class AutoMoLi(hass.Hass):  # type: ignore
                 self.lg(f"{indent}· {hl(item)}")
 
     def _print_cfg_setting(self, key: str, value: Union[int, str], indentation: int) -> None:
-        unit = prefix = ""
         indent = indentation * " "
 
         # legacy way
         if key == "delay" and isinstance(value, int):
-            unit = "min"
-            min_value = f"{int(value / 60)}:{int(value % 60):02d}"
-            self.lg(f"{indent}{key}: {prefix}{hl(min_value)}{unit} ≈ " f"{hl(value)}sec", ascii_encode=False)
+            minutes, seconds = divmod(value, SECONDS_PER_MIN)
+            self.lg(f"{indent}{key}: {hl(f'{minutes}:{seconds:02d}')}min ≈ {hl(value)}sec", ascii_encode=False)
 
         else:
-            if "_units" in self.config and key in self.config["_units"]:
-                unit = self.config["_units"][key]
-            if "_prefixes" in self.config and key in self.config["_prefixes"]:
-                prefix = self.config["_prefixes"][key]
+            unit = self.config.get("_units", {}).get(key, "")
+            prefix = self.config.get("_prefixes", {}).get(key, "")
 
             self.lg(f"{indent}{key}: {prefix}{hl(value)}{unit}")